@@ -0,0 +1,94 @@
+/**
+ * Tests for DaemonClient request/response framing.
+ */
+
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { createServer, type Server, type Socket } from 'node:net';
+import { mkdtemp, rm } from 'node:fs/promises';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import { DaemonClient } from '../client';
+
+describe('DaemonClient framing', () => {
+  let dir: string;
+  let socketPath: string;
+  let server: Server;
+  let requests: string[];
+  let respond: (socket: Socket) => void;
+
+  beforeEach(async () => {
+    dir = await mkdtemp(join(tmpdir(), 'multiclaude-sock-'));
+    socketPath = join(dir, 'daemon.sock');
+    requests = [];
+    server = createServer((socket) => {
+      socket.once('data', (chunk) => {
+        requests.push(chunk.toString());
+        respond(socket);
+      });
+    });
+    await new Promise<void>((resolve) => server.listen(socketPath, resolve));
+  });
+
+  afterEach(async () => {
+    vi.restoreAllMocks();
+    await new Promise<void>((resolve) => server.close(() => resolve()));
+    await rm(dir, { recursive: true, force: true });
+  });
+
+  it('writes argument-less commands as a single newline-terminated frame', async () => {
+    respond = (socket) => socket.write('{"success":true,"data":"pong"}\n');
+
+    await expect(new DaemonClient({ socketPath }).ping()).resolves.toBe(true);
+    expect(requests).toEqual(['{"command":"ping"}\n']);
+  });
+
+  it('reuses the pre-encoded frame instead of serializing argument-less commands', async () => {
+    respond = (socket) => socket.write('{"success":true,"data":"stopping"}\n');
+    const stringify = vi.spyOn(JSON, 'stringify');
+
+    await expect(new DaemonClient({ socketPath }).stop()).resolves.toBe('stopping');
+    expect(stringify).not.toHaveBeenCalled();
+    expect(requests).toEqual(['{"command":"stop"}\n']);
+  });
+
+  it('serializes commands with arguments per request', async () => {
+    respond = (socket) => socket.write('{"success":true,"data":"removed"}\n');
+    const stringify = vi.spyOn(JSON, 'stringify');
+
+    await new DaemonClient({ socketPath }).removeRepo('my-repo');
+    expect(stringify).toHaveBeenCalled();
+    expect(requests).toEqual(['{"command":"remove_repo","args":{"name":"my-repo"}}\n']);
+  });
+
+  it('resolves on the newline without waiting for the connection to close', async () => {
+    // Keep the connection open: only the frame terminator ends the response.
+    respond = (socket) => socket.write('{"success":true,"data":"ok"}\n');
+
+    await expect(new DaemonClient({ socketPath }).send('status')).resolves.toBe('ok');
+  });
+
+  it('reassembles a response split across chunks, including inside a character', async () => {
+    const frame = Buffer.from('{"success":true,"data":"héllo"}\n');
+    const split = frame.indexOf(Buffer.from('é')) + 1;
+    respond = (socket) => {
+      socket.write(frame.subarray(0, split));
+      setTimeout(() => socket.write(frame.subarray(split)), 10);
+    };
+
+    await expect(new DaemonClient({ socketPath }).send('status')).resolves.toBe('héllo');
+  });
+
+  it('parses an unterminated response when the daemon closes the connection', async () => {
+    respond = (socket) => socket.end('{"success":true,"data":"bye"}');
+
+    await expect(new DaemonClient({ socketPath }).send('status')).resolves.toBe('bye');
+  });
+
+  it('rejects a malformed newline-terminated response', async () => {
+    respond = (socket) => socket.write('not json\n');
+
+    await expect(new DaemonClient({ socketPath }).send('status')).rejects.toMatchObject({
+      code: 'INVALID_RESPONSE',
+    });
+  });
+});
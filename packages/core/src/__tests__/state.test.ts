@@ -0,0 +1,132 @@
+/**
+ * Tests for StateReader's watch-triggered reads.
+ */
+
+import { describe, it, expect, beforeEach, afterEach } from 'vitest';
+import { once } from 'node:events';
+import { mkdtemp, rm, writeFile } from 'node:fs/promises';
+import { tmpdir } from 'node:os';
+import { join } from 'node:path';
+import { StateReader } from '../state';
+import type { State } from '../schemas';
+
+/**
+ * Long enough for chokidar's awaitWriteFinish and the debounce to settle.
+ */
+const SETTLE_MS = 300;
+
+function stateJson(pid: number): string {
+  return JSON.stringify({
+    repos: {
+      'my-repo': {
+        github_url: 'https://github.com/owner/repo',
+        tmux_session: 'mc-my-repo',
+        agents: {
+          supervisor: {
+            type: 'supervisor',
+            worktree_path: '/path',
+            tmux_window: 'supervisor',
+            session_id: 'sess',
+            pid,
+            created_at: '2026-01-25T12:00:00Z',
+          },
+        },
+      },
+    },
+  });
+}
+
+function supervisorPid(state: State | null): number | undefined {
+  return state?.repos['my-repo']?.agents['supervisor']?.pid;
+}
+
+describe('StateReader watch reads', () => {
+  let dir: string;
+  let statePath: string;
+  let reader: StateReader;
+  let changes: State[];
+  let errors: Error[];
+
+  /**
+   * Write the initial state and start watching, resolving once the watcher is ready.
+   */
+  async function startWith(content: string): Promise<void> {
+    await writeFile(statePath, content);
+    const ready = once(reader, 'ready');
+    await reader.start();
+    await ready;
+  }
+
+  /**
+   * Rewrite the state file and wait for the change it triggers.
+   */
+  async function writeAndWaitForChange(content: string): Promise<State> {
+    const change = once(reader, 'change') as Promise<[State]>;
+    await writeFile(statePath, content);
+    const [state] = await change;
+    return state;
+  }
+
+  beforeEach(async () => {
+    dir = await mkdtemp(join(tmpdir(), 'multiclaude-state-'));
+    statePath = join(dir, 'state.json');
+    reader = new StateReader({ statePath, debounceMs: 10 });
+    changes = [];
+    errors = [];
+    reader.on('change', (state) => changes.push(state));
+    // Keep a listener attached so a reported error is not rethrown as unhandled.
+    reader.on('error', (error) => errors.push(error));
+  });
+
+  afterEach(async () => {
+    await reader.stop();
+    await rm(dir, { recursive: true, force: true });
+  });
+
+  it('does not re-emit when a rewrite leaves the content unchanged', async () => {
+    await startWith(stateJson(1111));
+    const initial = reader.getState();
+
+    await writeFile(statePath, stateJson(1111));
+    await new Promise((resolve) => setTimeout(resolve, SETTLE_MS));
+
+    expect(changes).toHaveLength(1);
+    expect(reader.getState()).toBe(initial);
+  });
+
+  it('emits a same-size rewrite', async () => {
+    await startWith(stateJson(1111));
+
+    // Same byte length, so only the content distinguishes the two writes.
+    const state = await writeAndWaitForChange(stateJson(2222));
+
+    expect(supervisorPid(state)).toBe(2222);
+    expect(changes).toHaveLength(2);
+  });
+
+  it('reports a truncated file as an error and keeps the last good state', async () => {
+    await startWith(stateJson(1111));
+    const good = reader.getState();
+
+    const error = once(reader, 'error');
+    await writeFile(statePath, stateJson(2222).slice(0, -10));
+    await error;
+
+    expect(errors[0]?.message).toContain('State file is truncated');
+    expect(reader.getState()).toBe(good);
+    expect(changes).toHaveLength(1);
+  });
+
+  it('parses the complete write that follows a truncated one', async () => {
+    await startWith(stateJson(1111));
+
+    const error = once(reader, 'error');
+    await writeFile(statePath, stateJson(2222).slice(0, -10));
+    await error;
+
+    const state = await writeAndWaitForChange(stateJson(2222));
+
+    expect(supervisorPid(state)).toBe(2222);
+    expect(changes).toHaveLength(2);
+  });
+});
@@ -28,6 +28,45 @@ export function defaultSocketPath(): string {
   return join(homedir(), '.multiclaude', 'daemon.sock');
 }
 
+/**
+ * Commands that never take arguments. The argument-less methods send
+ * them through sendCommand, which only accepts names from this list.
+ */
+const NO_ARG_COMMANDS = [
+  'ping',
+  'status',
+  'stop',
+  'list_repos',
+  'get_current_repo',
+  'clear_current_repo',
+  'trigger_cleanup',
+  'repair_state',
+  'route_messages',
+] as const;
+
+type NoArgCommand = (typeof NO_ARG_COMMANDS)[number];
+
+/**
+ * Pre-encoded frames for NO_ARG_COMMANDS.
+ * These are fixed strings, so they are serialized once at load time.
+ */
+const NO_ARG_FRAMES: ReadonlyMap<string, string> = new Map(
+  NO_ARG_COMMANDS.map((command): [string, string] => [command, JSON.stringify({ command }) + '\n'])
+);
+
+/**
+ * Encode a request as a newline-terminated frame.
+ */
+function encodeRequest(request: SocketRequest): string {
+  if (!request.args) {
+    const frame = NO_ARG_FRAMES.get(request.command);
+    if (frame) {
+      return frame;
+    }
+  }
+  return JSON.stringify(request) + '\n';
+}
+
 /**
  * Error thrown when daemon operations fail.
  */
@@ -90,12 +129,19 @@ export class DaemonClient {
     return parsed.data as T;
   }
 
+  /**
+   * Send an argument-less command, reusing its pre-encoded frame.
+   */
+  private sendCommand<T = unknown>(command: NoArgCommand): Promise<T> {
+    return this.send<T>(command);
+  }
+
   /**
    * Check if daemon is alive.
    */
   async ping(): Promise<boolean> {
     try {
-      const result = await this.send<string>('ping');
+      const result = await this.sendCommand<string>('ping');
       return result === 'pong';
     } catch {
       return false;
@@ -106,7 +152,7 @@ export class DaemonClient {
    * Get daemon status.
    */
   async status(): Promise<DaemonStatus> {
-    const data = await this.send('status');
+    const data = await this.sendCommand('status');
     return parseDaemonStatus(data);
   }
 
@@ -114,14 +160,14 @@ export class DaemonClient {
    * Stop the daemon gracefully.
    */
   async stop(): Promise<string> {
-    return this.send<string>('stop');
+    return this.sendCommand<string>('stop');
   }
 
   /**
    * List all tracked repositories.
    */
   async listRepos(): Promise<string[]> {
-    const data = await this.send<{ repos: string[] }>('list_repos');
+    const data = await this.sendCommand<{ repos: string[] }>('list_repos');
     return data.repos;
   }
 
@@ -189,14 +235,14 @@ export class DaemonClient {
    * Get the current/default repository name.
    */
   async getCurrentRepo(): Promise<string> {
-    return this.send<string>('get_current_repo');
+    return this.sendCommand<string>('get_current_repo');
   }
 
   /**
    * Clear the current/default repository.
    */
   async clearCurrentRepo(): Promise<string> {
-    return this.send<string>('clear_current_repo');
+    return this.sendCommand<string>('clear_current_repo');
   }
 
   /**
@@ -281,21 +327,21 @@ export class DaemonClient {
    * Trigger immediate cleanup of dead agents.
    */
   async triggerCleanup(): Promise<string> {
-    return this.send<string>('trigger_cleanup');
+    return this.sendCommand<string>('trigger_cleanup');
   }
 
   /**
    * Repair inconsistent state.
    */
   async repairState(): Promise<string> {
-    return this.send<string>('repair_state');
+    return this.sendCommand<string>('repair_state');
   }
 
   /**
    * Trigger immediate message routing.
    */
   async routeMessages(): Promise<string> {
-    return this.send<string>('route_messages');
+    return this.sendCommand<string>('route_messages');
   }
 
   /**
@@ -326,19 +372,32 @@ export class DaemonClient {
         }, this.timeout);
 
         socket.on('connect', () => {
-          socket?.write(JSON.stringify(request) + '\n');
+          socket?.write(encodeRequest(request));
         });
 
-        let data = '';
-        socket.on('data', (chunk) => {
-          data += chunk.toString();
+        // Collect raw chunks and decode once, so large responses aren't
+        // re-copied into a growing string and multi-byte characters split
+        // across chunks decode correctly.
+        const chunks: Buffer[] = [];
+        socket.on('data', (chunk: Buffer) => {
+          chunks.push(chunk);
+
+          // Responses are newline-terminated, so only parse once the frame is
+          // complete rather than re-parsing the growing buffer on every chunk.
+          if (!chunk.includes(0x0a)) {
+            return;
+          }
 
           try {
-            const response = JSON.parse(data) as SocketResponse;
+            const data = chunks.length === 1 ? chunk : Buffer.concat(chunks);
+            const response = JSON.parse(
+              data.toString('utf8', 0, data.indexOf(0x0a))
+            ) as SocketResponse;
             cleanup();
             resolve(response);
           } catch {
-            // Incomplete JSON, wait for more data
+            cleanup();
+            reject(new DaemonError('Invalid response from daemon', 'INVALID_RESPONSE'));
           }
         });
 
@@ -354,9 +413,9 @@ export class DaemonClient {
         });
 
         socket.on('close', () => {
-          if (data && socket) {
+          if (chunks.length > 0 && socket) {
             try {
-              const response = JSON.parse(data) as SocketResponse;
+              const response = JSON.parse(Buffer.concat(chunks).toString('utf8')) as SocketResponse;
               cleanup();
               resolve(response);
             } catch {
@@ -25,7 +25,12 @@ export type {
   DaemonStatus,
 } from './types.js';
 
-export { isPersistentAgentType, defaultMergeQueueConfig, defaultPRShepherdConfig } from './types.js';
+export {
+  PERSISTENT_AGENT_TYPES,
+  isPersistentAgentType,
+  defaultMergeQueueConfig,
+  defaultPRShepherdConfig,
+} from './types.js';
 
 // Re-export schemas
 export {
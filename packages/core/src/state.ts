@@ -69,6 +69,7 @@ export class StateReader extends EventEmitter {
   private readonly emitInitial: boolean;
   private watcher: FSWatcher | null = null;
   private currentState: State | null = null;
+  private currentRaw: string | null = null;
   private debounceTimer: NodeJS.Timeout | null = null;
 
   constructor(options: StateReaderOptions = {}) {
@@ -189,16 +190,41 @@ export class StateReader extends EventEmitter {
 
     this.debounceTimer = setTimeout(() => {
       this.debounceTimer = null;
-      void this.readAndEmit(true);
+      this.readAndEmit(true, true).catch((error: unknown) => {
+        // readAndEmit has already emitted 'error' to any listeners. With none
+        // attached, rethrow like an unhandled EventEmitter 'error' would.
+        if (this.listenerCount('error') === 0) {
+          queueMicrotask(() => {
+            throw error;
+          });
+        }
+      });
     }, this.debounceMs);
   }
 
-  private async readAndEmit(shouldEmit: boolean): Promise<State> {
+  private async readAndEmit(shouldEmit: boolean, fromWatcher = false): Promise<State> {
     try {
       const data = await readFile(this.statePath, 'utf8');
+
+      // A single write can fire several watch events (e.g. add + change on an
+      // atomic rename). If the content is identical to what we last parsed,
+      // reuse that state instead of re-validating and re-emitting it.
+      if (fromWatcher && this.currentState && data === this.currentRaw) {
+        return this.currentState;
+      }
+
+      // Best-effort wording only: name the likely cause (daemon crash, disk
+      // full) instead of a JSON syntax error. The read fails either way, and a
+      // file cut off right after a nested '}' passes this check and is still
+      // reported by JSON.parse below.
+      if (fromWatcher && !data.trimEnd().endsWith('}')) {
+        throw new Error(`State file is truncated: ${this.statePath}`);
+      }
+
       const json: unknown = JSON.parse(data);
       const state = parseState(json);
       this.currentState = state;
+      this.currentRaw = data;
 
       if (shouldEmit) {
         this.emit('change', state);
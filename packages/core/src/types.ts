@@ -203,13 +203,23 @@ export interface DaemonStatus {
   socket_path: string;
 }
 
+/**
+ * Agent types that are persistent (auto-restarted when dead).
+ * Built once so the check below is a single lookup with no allocation.
+ */
+export const PERSISTENT_AGENT_TYPES: ReadonlySet<AgentType> = new Set<AgentType>([
+  'supervisor',
+  'merge-queue',
+  'pr-shepherd',
+  'workspace',
+  'generic-persistent',
+]);
+
 /**
  * Helper to check if an agent type is persistent (auto-restarted when dead).
  */
 export function isPersistentAgentType(type: AgentType): boolean {
-  return ['supervisor', 'merge-queue', 'pr-shepherd', 'workspace', 'generic-persistent'].includes(
-    type
-  );
+  return PERSISTENT_AGENT_TYPES.has(type);
 }
 
 /**
@@ -3,7 +3,7 @@ import { MessageFeed } from './components/MessageFeed';
 import { TaskDashboard } from './components/TaskDashboard';
 import { useMulticlaude, useDaemonStatus } from './hooks/useMulticlaude';
 import { useDaemonCommands } from './hooks/useDaemonCommands';
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useMemo } from 'react';
 
 /**
  * Main dashboard application.
@@ -36,12 +36,28 @@ function App() {
     }
   }, [state, currentRepo]);
 
+  // Per-repo agent counts, derived once per state snapshot instead of
+  // re-scanning every repo's agents on each render.
+  const agentCounts = useMemo(() => {
+    const counts: Record<string, { total: number; running: number }> = {};
+    for (const [repo, repoState] of Object.entries(state?.repos ?? {})) {
+      let total = 0;
+      let running = 0;
+      for (const agent of Object.values(repoState.agents)) {
+        total++;
+        if (agent.pid > 0 && !agent.ready_for_cleanup) {
+          running++;
+        }
+      }
+      counts[repo] = { total, running };
+    }
+    return counts;
+  }, [state]);
+
   const repos = state ? Object.keys(state.repos) : [];
   const currentAgents = currentRepo ? state?.repos[currentRepo]?.agents ?? {} : {};
-  const agentCount = Object.keys(currentAgents).length;
-  const runningAgentCount = Object.values(currentAgents).filter(
-    (a) => a.pid > 0 && !a.ready_for_cleanup
-  ).length;
+  const agentCount = currentRepo ? agentCounts[currentRepo]?.total ?? 0 : 0;
+  const runningAgentCount = currentRepo ? agentCounts[currentRepo]?.running ?? 0 : 0;
 
   const handleStopAll = async () => {
     if (!currentRepo) return;
@@ -85,11 +101,8 @@ function App() {
             <p className="text-gray-500 text-sm">No repositories tracked</p>
           ) : (
             repos.map((repo) => {
-              const repoAgents = state?.repos[repo]?.agents ?? {};
-              const repoAgentCount = Object.keys(repoAgents).length;
-              const repoRunning = Object.values(repoAgents).filter(
-                (a) => a.pid > 0 && !a.ready_for_cleanup
-              ).length;
+              const repoAgentCount = agentCounts[repo]?.total ?? 0;
+              const repoRunning = agentCounts[repo]?.running ?? 0;
 
               return (
                 <button
@@ -6,10 +6,9 @@ the TypeScript types in @multiclaude/core. Use these for building Python
 tools and integrations with the multiclaude daemon.
 
 Example:
+    >>> from pathlib import Path
     >>> from multiclaude_types import State, parse_state
-    >>> import json
-    >>> with open("~/.multiclaude/state.json") as f:
-    ...     state = parse_state(json.load(f))
+    >>> state = parse_state((Path.home() / ".multiclaude" / "state.json").read_bytes())
     >>> print(f"Tracking {len(state.repos)} repositories")
 """
 
@@ -25,6 +24,7 @@ from .types import (
     SocketRequest,
     SocketResponse,
     State,
+    TaskHistoryColumnar,
     TaskHistoryEntry,
     TaskStatus,
     TrackMode,
@@ -36,6 +36,7 @@ from .types import (
     parse_repository,
     parse_socket_response,
     parse_state,
+    parse_task_history,
     safe_parse_state,
 )
 
@@ -51,6 +52,7 @@ __all__ = [
     "SocketRequest",
     "SocketResponse",
     "State",
+    "TaskHistoryColumnar",
     "TaskHistoryEntry",
     "TaskStatus",
     "TrackMode",
@@ -62,6 +64,7 @@ __all__ = [
     "parse_repository",
     "parse_socket_response",
     "parse_state",
+    "parse_task_history",
     "safe_parse_state",
 ]
 
@@ -0,0 +1,191 @@
+"""
+Tests for the Pydantic models and parsing utilities.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from multiclaude_types import (
+    TaskHistoryColumnar,
+    TaskHistoryEntry,
+    parse_agent,
+    parse_daemon_status,
+    parse_repository,
+    parse_socket_response,
+    parse_state,
+    parse_task_history,
+    safe_parse_state,
+)
+from pydantic import BaseModel, ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from multiclaude_types import TaskStatus
+
+AGENT: dict[str, Any] = {
+    "type": "worker",
+    "worktree_path": "/path/to/worktree",
+    "tmux_window": "clever-fox",
+    "session_id": "sess-1",
+    "pid": 1234,
+    "task": "Add authentication",
+    "created_at": "2026-01-25T12:00:00Z",
+}
+HISTORY_ENTRY: dict[str, Any] = {
+    "name": "clever-fox",
+    "task": "Add authentication",
+    "branch": "work/clever-fox",
+    "pr_number": 42,
+    "status": "merged",
+    "created_at": "2026-01-25T12:00:00Z",
+}
+REPOSITORY: dict[str, Any] = {
+    "github_url": "https://github.com/owner/repo",
+    "tmux_session": "mc-my-repo",
+    "agents": {"clever-fox": AGENT},
+    "task_history": [HISTORY_ENTRY],
+}
+STATE: dict[str, Any] = {"repos": {"my-repo": REPOSITORY}, "current_repo": "my-repo"}
+
+
+def make_entry(
+    name: str, status: TaskStatus = "merged", pr_number: int | None = None
+) -> TaskHistoryEntry:
+    return TaskHistoryEntry(
+        name=name,
+        task=f"task for {name}",
+        branch=f"work/{name}",
+        pr_number=pr_number,
+        status=status,
+        created_at="2026-01-25T12:00:00Z",
+    )
+
+
+class TestTaskHistoryColumnar:
+    def test_builds_aligned_columns_from_entries(self) -> None:
+        history = TaskHistoryColumnar([make_entry("a"), make_entry("b", "failed", 7)])
+
+        assert len(history) == 2
+        assert history.names == ("a", "b")
+        assert history.branches == ("work/a", "work/b")
+        assert history.pr_numbers == (None, 7)
+
+    def test_defaults_to_empty(self) -> None:
+        history = TaskHistoryColumnar()
+
+        assert len(history) == 0
+        assert list(history) == []
+        assert history.filter_by_status("failed") == []
+
+    def test_filter_by_status(self) -> None:
+        history = TaskHistoryColumnar(
+            [make_entry("a", "failed"), make_entry("b", "open"), make_entry("c", "failed")]
+        )
+
+        assert history.filter_by_status("failed") == [0, 2]
+        assert history.filter_by_status("open") == [1]
+        assert history.filter_by_status("closed") == []
+
+    def test_statuses_decode_the_status_column(self) -> None:
+        history = TaskHistoryColumnar([make_entry("a", "failed"), make_entry("b", "no-pr")])
+
+        assert history.statuses == ("failed", "no-pr")
+        assert history.statuses is history.statuses
+
+    def test_statuses_is_read_only(self) -> None:
+        history = TaskHistoryColumnar([make_entry("a")])
+
+        with pytest.raises(AttributeError):
+            history.statuses = ("open",)  # type: ignore[misc]
+
+    def test_filter_by_pr_number(self) -> None:
+        history = TaskHistoryColumnar(
+            [make_entry("a", pr_number=3), make_entry("b"), make_entry("c", pr_number=3)]
+        )
+
+        assert history.filter_by_pr_number(3) == [0, 2]
+        assert history.filter_by_pr_number(4) == []
+
+    def test_indexing_materializes_entries(self) -> None:
+        entries = [make_entry("a"), make_entry("b", "failed", 7)]
+        history = TaskHistoryColumnar(entries)
+
+        assert history[0] == entries[0]
+        assert history[-1] == entries[1]
+        assert history[-1].status == "failed"
+
+    def test_iterates_over_entries(self) -> None:
+        entries = [make_entry("a"), make_entry("b", "failed"), make_entry("c", "no-pr")]
+
+        assert list(TaskHistoryColumnar(entries)) == entries
+
+
+PARSERS: list[tuple[Callable[[Any], BaseModel], dict[str, Any]]] = [
+    (parse_state, STATE),
+    (parse_repository, REPOSITORY),
+    (parse_agent, AGENT),
+    (parse_socket_response, {"success": True, "data": {"repos": ["my-repo"]}}),
+    (
+        parse_daemon_status,
+        {"running": True, "pid": 1, "repos": 1, "agents": 1, "socket_path": "/tmp/d.sock"},
+    ),
+]
+
+
+class TestParseFunctions:
+    @pytest.mark.parametrize(("parse", "data"), PARSERS)
+    def test_raw_json_matches_decoded_dict(
+        self, parse: Callable[[Any], BaseModel], data: dict[str, Any]
+    ) -> None:
+        raw = json.dumps(data)
+        expected = parse(data)
+
+        assert parse(raw) == expected
+        assert parse(raw.encode()) == expected
+
+    @pytest.mark.parametrize("parse", [parse for parse, _ in PARSERS])
+    def test_raw_json_is_validated(self, parse: Callable[[Any], BaseModel]) -> None:
+        with pytest.raises(ValidationError):
+            parse(b"{}")
+        with pytest.raises(ValidationError):
+            parse(b"not json")
+
+    def test_parse_state_builds_nested_models(self) -> None:
+        state = parse_state(json.dumps(STATE).encode())
+
+        repo = state.repos["my-repo"]
+        assert repo.agents["clever-fox"].pid == 1234
+        assert repo.task_history == [TaskHistoryEntry(**HISTORY_ENTRY)]
+
+    def test_safe_parse_state_returns_none_on_invalid_input(self) -> None:
+        assert safe_parse_state(b'{"repos": []}') is None
+        assert safe_parse_state({"repos": []}) is None
+        assert safe_parse_state(json.dumps(STATE)) == parse_state(STATE)
+
+
+class TestParseTaskHistory:
+    def test_parses_decoded_list(self) -> None:
+        history = parse_task_history([HISTORY_ENTRY, {**HISTORY_ENTRY, "status": "failed"}])
+
+        assert [e.status for e in history] == ["merged", "failed"]
+        assert history[0] == TaskHistoryEntry(**HISTORY_ENTRY)
+
+    def test_parses_raw_json(self) -> None:
+        raw = json.dumps([HISTORY_ENTRY])
+
+        assert parse_task_history(raw) == [TaskHistoryEntry(**HISTORY_ENTRY)]
+        assert parse_task_history(raw.encode()) == [TaskHistoryEntry(**HISTORY_ENTRY)]
+
+    def test_parses_empty_list(self) -> None:
+        assert parse_task_history([]) == []
+        assert parse_task_history(b"[]") == []
+
+    def test_rejects_invalid_entries(self) -> None:
+        with pytest.raises(ValidationError):
+            parse_task_history([{**HISTORY_ENTRY, "status": "done"}])
+        with pytest.raises(ValidationError):
+            parse_task_history(b'{"not": "a list"}')
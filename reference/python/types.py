@@ -9,9 +9,12 @@ Uses Pydantic for runtime validation (Python's equivalent of Zod).
 
 from __future__ import annotations
 
-from typing import Any, Generic, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar, get_args
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
 
 # ============================================================================
 # Enum-like Literal Types
@@ -139,6 +142,109 @@ class TaskHistoryEntry(BaseModel):
     """When the task was completed (ISO 8601)."""
 
 
+_TASK_STATUSES: tuple[TaskStatus, ...] = get_args(TaskStatus)
+_TASK_STATUS_CODES: dict[TaskStatus, int] = {s: i for i, s in enumerate(_TASK_STATUSES)}
+
+
+class TaskHistoryColumnar:
+    """
+    Column-oriented view of a task history for bulk filtering.
+
+    Each attribute holds one column, index-aligned across all columns.
+    Scans such as "all failed tasks" walk a single column instead of
+    touching every TaskHistoryEntry. Entries are only materialized
+    when indexed or iterated.
+
+    Build it from validated entries, e.g.
+    TaskHistoryColumnar(repo.task_history or []); the columns are derived
+    from those entries, so they always have the same length.
+
+    Statuses are stored internally one byte per entry, as their index
+    in TaskStatus, so status filters compare small ints.
+    """
+
+    __slots__ = (
+        "_status_codes",
+        "_statuses",
+        "branches",
+        "completed_ats",
+        "created_ats",
+        "failure_reasons",
+        "names",
+        "pr_numbers",
+        "pr_urls",
+        "summaries",
+        "tasks",
+    )
+
+    def __init__(self, entries: Iterable[TaskHistoryEntry] = ()) -> None:
+        items = list(entries)
+        self.names: tuple[str, ...] = tuple(e.name for e in items)
+        """Worker names."""
+        self.tasks: tuple[str, ...] = tuple(e.task for e in items)
+        """Task descriptions."""
+        self.branches: tuple[str, ...] = tuple(e.branch for e in items)
+        """Git branches."""
+        self.pr_urls: tuple[str | None, ...] = tuple(e.pr_url for e in items)
+        """Pull request URLs, None where no PR was created."""
+        self.pr_numbers: tuple[int | None, ...] = tuple(e.pr_number for e in items)
+        """PR numbers, None where no PR was created."""
+        self._status_codes = bytes(_TASK_STATUS_CODES[e.status] for e in items)
+        self._statuses: tuple[TaskStatus, ...] | None = None
+        self.summaries: tuple[str | None, ...] = tuple(e.summary for e in items)
+        """Brief summaries of what was accomplished."""
+        self.failure_reasons: tuple[str | None, ...] = tuple(e.failure_reason for e in items)
+        """Why each task failed (if applicable)."""
+        self.created_ats: tuple[str, ...] = tuple(e.created_at for e in items)
+        """When each task was started (ISO 8601)."""
+        self.completed_ats: tuple[str | None, ...] = tuple(e.completed_at for e in items)
+        """When each task was completed (ISO 8601)."""
+
+    @property
+    def statuses(self) -> tuple[TaskStatus, ...]:
+        """
+        Task statuses.
+
+        Decoded from the status codes on first access and cached, so
+        repeated reads such as statuses[i] in a loop cost O(1) each.
+        """
+        if self._statuses is None:
+            self._statuses = tuple(_TASK_STATUSES[c] for c in self._status_codes)
+        return self._statuses
+
+    def filter_by_status(self, status: TaskStatus) -> list[int]:
+        """Return the indices of entries with the given status."""
+        code = _TASK_STATUS_CODES[status]
+        return [i for i, c in enumerate(self._status_codes) if c == code]
+
+    def filter_by_pr_number(self, pr_number: int) -> list[int]:
+        """Return the indices of entries for the given PR number."""
+        return [i for i, n in enumerate(self.pr_numbers) if n == pr_number]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __getitem__(self, index: int) -> TaskHistoryEntry:
+        """Materialize the entry at the given index."""
+        return TaskHistoryEntry.model_construct(
+            name=self.names[index],
+            task=self.tasks[index],
+            branch=self.branches[index],
+            pr_url=self.pr_urls[index],
+            pr_number=self.pr_numbers[index],
+            status=_TASK_STATUSES[self._status_codes[index]],
+            summary=self.summaries[index],
+            failure_reason=self.failure_reasons[index],
+            created_at=self.created_ats[index],
+            completed_at=self.completed_ats[index],
+        )
+
+    def __iter__(self) -> Iterator[TaskHistoryEntry]:
+        """Materialize entries in order."""
+        for i in range(len(self)):
+            yield self[i]
+
+
 # ============================================================================
 # Agent Model
 # ============================================================================
@@ -321,17 +427,23 @@ def default_pr_shepherd_config() -> PRShepherdConfig:
 # ============================================================================
 
 
-def parse_state(data: dict[str, Any]) -> State:
+def parse_state(data: dict[str, Any] | str | bytes) -> State:
     """
     Parse and validate state data, raising on invalid input.
 
+    Accepts either an already-decoded dict or the raw JSON text of
+    state.json. Raw JSON is parsed and validated in a single pass by
+    pydantic-core, without building an intermediate dict.
+
     Raises:
         pydantic.ValidationError: If data doesn't match State schema.
     """
+    if isinstance(data, (str, bytes)):
+        return State.model_validate_json(data)
     return State.model_validate(data)
 
 
-def safe_parse_state(data: dict[str, Any]) -> State | None:
+def safe_parse_state(data: dict[str, Any] | str | bytes) -> State | None:
     """
     Safely parse state data, returning None on invalid input.
 
@@ -339,46 +451,75 @@ def safe_parse_state(data: dict[str, Any]) -> State | None:
         Validated State object, or None if validation fails.
     """
     try:
-        return State.model_validate(data)
-    except Exception:
+        return parse_state(data)
+    except ValidationError:
         return None
 
 
-def parse_repository(data: dict[str, Any]) -> Repository:
+def parse_repository(data: dict[str, Any] | str | bytes) -> Repository:
     """
     Parse and validate a repository, raising on invalid input.
 
     Raises:
         pydantic.ValidationError: If data doesn't match Repository schema.
     """
+    if isinstance(data, (str, bytes)):
+        return Repository.model_validate_json(data)
     return Repository.model_validate(data)
 
 
-def parse_agent(data: dict[str, Any]) -> Agent:
+def parse_agent(data: dict[str, Any] | str | bytes) -> Agent:
     """
     Parse and validate an agent, raising on invalid input.
 
     Raises:
         pydantic.ValidationError: If data doesn't match Agent schema.
     """
+    if isinstance(data, (str, bytes)):
+        return Agent.model_validate_json(data)
     return Agent.model_validate(data)
 
 
-def parse_socket_response(data: dict[str, Any]) -> SocketResponse[Any]:
+_TASK_HISTORY_ADAPTER: TypeAdapter[list[TaskHistoryEntry]] = TypeAdapter(list[TaskHistoryEntry])
+
+
+def parse_task_history(data: list[dict[str, Any]] | str | bytes) -> list[TaskHistoryEntry]:
+    """
+    Parse and validate a list of task history entries, raising on invalid input.
+
+    The whole list is validated in one call rather than one
+    TaskHistoryEntry.model_validate per entry.
+
+    Raises:
+        pydantic.ValidationError: If data doesn't match the TaskHistoryEntry schema.
+    """
+    if isinstance(data, (str, bytes)):
+        return _TASK_HISTORY_ADAPTER.validate_json(data)
+    return _TASK_HISTORY_ADAPTER.validate_python(data)
+
+
+def parse_socket_response(data: dict[str, Any] | str | bytes) -> SocketResponse[Any]:
     """
     Parse and validate a socket response, raising on invalid input.
 
+    Pass the raw response line read from the socket to skip the
+    separate json.loads step.
+
     Raises:
         pydantic.ValidationError: If data doesn't match SocketResponse schema.
     """
+    if isinstance(data, (str, bytes)):
+        return SocketResponse.model_validate_json(data)
     return SocketResponse.model_validate(data)
 
 
-def parse_daemon_status(data: dict[str, Any]) -> DaemonStatus:
+def parse_daemon_status(data: dict[str, Any] | str | bytes) -> DaemonStatus:
     """
     Parse and validate daemon status, raising on invalid input.
 
     Raises:
         pydantic.ValidationError: If data doesn't match DaemonStatus schema.
     """
+    if isinstance(data, (str, bytes)):
+        return DaemonStatus.model_validate_json(data)
     return DaemonStatus.model_validate(data)